@@ -17,19 +17,18 @@ def run_ga_solver(maze: Maze, **kwargs: Any) -> None:
     print(maze)
     print()
 
-    solver = GASolver(
+    with GASolver(
         maze=maze,
         **kwargs,
-    )
-
-    best_path, stats = solver.solve(verbose=True)
+    ) as solver:
+        best_path, stats = solver.solve(verbose=True)
 
-    # Visualize the result
-    print("\n" + "=" * 60)
-    print("SOLUTION PATH")
-    print("=" * 60)
-    print(solver.visualize_path(best_path))
-    print(f"\nPath directions: {[d.value for d in best_path[:30]]}")
+        # Visualize the result
+        print("\n" + "=" * 60)
+        print("SOLUTION PATH")
+        print("=" * 60)
+        print(solver.visualize_path(best_path, stats["best_trace"]))
+    print(f"\nPath directions: {[d.label for d in best_path[:30]]}")
     if len(best_path) > 30:
         print(f"... (showing first 30 of {len(best_path)} moves)")
 
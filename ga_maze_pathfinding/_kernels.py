@@ -0,0 +1,257 @@
+"""Compiled kernels simulating paths of direction codes through a maze wall grid.
+
+All kernels release the GIL. Only the main thread launches the parallel kernel; other threads use
+the serial one, so solvers running in separate Python threads evaluate concurrently.
+"""
+
+import threading
+
+import numpy as np
+from numba import get_num_threads, njit, prange
+
+from ga_maze_pathfinding.maze import DIR_DELTAS
+
+# Row/column deltas of each direction code
+DR = np.array([dr for dr, _ in DIR_DELTAS], dtype=np.intp)
+DC = np.array([dc for _, dc in DIR_DELTAS], dtype=np.intp)
+
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def simulate(
+    path: np.ndarray,
+    walls: np.ndarray,
+    offsets: np.ndarray,
+    start_cell: int,
+    end_cell: int,
+    visited: np.ndarray,
+    stamp: int,
+    trace: np.ndarray,
+) -> tuple[int, int, int, int, bool]:
+    """Walk a path of direction codes through the maze.
+
+    Cells are flat indices into the wall grid padded with a one-cell wall border, so a move is a single
+    offset and leaving the maze is just another wall hit, with no bounds checks.
+
+    Args:
+        path: int8 array of direction codes
+        walls: Flat row-major uint8 array of the padded grid, where non-zero cells are walls
+        offsets: Flat index offset of each direction code in the padded grid
+        start_cell: Padded index of the start
+        end_cell: Padded index of the goal
+        visited: Per-cell buffer of the padded grid, shared between calls; cells equal to `stamp` were visited
+        stamp: Value unique to this call, so the buffer never needs clearing
+        trace: Buffer of at least `len(path) + 1` entries receiving the padded index of every cell stepped on,
+            so the first `path_length` entries hold the walked route
+
+    Returns:
+        Tuple of (collisions, final_cell, path_length, unique_cells_visited, reached)
+    """
+    cell = start_cell
+    visited[cell] = stamp
+    trace[0] = cell
+    collisions = 0
+    path_length = 1
+    unique_cells_visited = 1
+    reached = False
+
+    for step in range(path.shape[0]):
+        new_cell = cell + offsets[path[step]]
+
+        # Don't move if hit wall (the border makes out of bounds a wall too)
+        if walls[new_cell] == 0:
+            cell = new_cell
+            trace[path_length] = cell
+            path_length += 1
+            if visited[cell] != stamp:
+                visited[cell] = stamp
+                unique_cells_visited += 1
+        else:
+            collisions += 1
+
+        # Early stop if reached goal
+        if cell == end_cell:
+            reached = True
+            break
+
+    return collisions, cell, path_length, unique_cells_visited, reached
+
+
+@njit(cache=True, nogil=True)
+def _simulate_range(
+    paths: np.ndarray,
+    walls: np.ndarray,
+    rows: int,
+    cols: int,
+    start_row: int,
+    start_col: int,
+    end_row: int,
+    end_col: int,
+    first: int,
+    stop: int,
+    results: np.ndarray,
+) -> None:
+    """Run `simulate` for rows `first` to `stop` of `paths`, writing one row of `results` per path."""
+    stride = cols + 2
+    offsets = DR * stride + DC
+    start_cell = (start_row + 1) * stride + start_col + 1
+    end_cell = (end_row + 1) * stride + end_col + 1
+
+    # Visited and trace buffers are shared by the rows of the range
+    visited = np.zeros((rows + 2) * stride, dtype=np.int64)
+    trace = np.empty(paths.shape[1] + 1, dtype=np.int64)
+    for i in range(first, stop):
+        collisions, cell, path_length, unique_cells_visited, reached = simulate(
+            paths[i], walls, offsets, start_cell, end_cell, visited, i + 1, trace
+        )
+        results[i, 0] = collisions
+        results[i, 1] = cell // stride - 1
+        results[i, 2] = cell % stride - 1
+        results[i, 3] = path_length
+        results[i, 4] = unique_cells_visited
+        results[i, 5] = reached
+
+
+@njit(cache=True, nogil=True)
+def _simulate_rows(
+    paths: np.ndarray,
+    walls: np.ndarray,
+    rows: int,
+    cols: int,
+    start_row: int,
+    start_col: int,
+    end_row: int,
+    end_col: int,
+) -> np.ndarray:
+    """Run `simulate` for every row on the calling thread."""
+    results = np.empty((paths.shape[0], 6), dtype=np.int64)
+    _simulate_range(paths, walls, rows, cols, start_row, start_col, end_row, end_col, 0, paths.shape[0], results)
+    return results
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _simulate_blocks(
+    paths: np.ndarray,
+    walls: np.ndarray,
+    rows: int,
+    cols: int,
+    start_row: int,
+    start_col: int,
+    end_row: int,
+    end_col: int,
+    n_blocks: int,
+) -> np.ndarray:
+    """Run `simulate` for every row, splitting the rows into `n_blocks` contiguous blocks simulated in parallel."""
+    n_paths = paths.shape[0]
+    results = np.empty((n_paths, 6), dtype=np.int64)
+    for block in prange(n_blocks):
+        _simulate_range(
+            paths,
+            walls,
+            rows,
+            cols,
+            start_row,
+            start_col,
+            end_row,
+            end_col,
+            block * n_paths // n_blocks,
+            (block + 1) * n_paths // n_blocks,
+            results,
+        )
+    return results
+
+
+def simulate_population(
+    paths: np.ndarray,
+    walls: np.ndarray,
+    rows: int,
+    cols: int,
+    start_row: int,
+    start_col: int,
+    end_row: int,
+    end_col: int,
+) -> np.ndarray:
+    """Run `simulate` for every row of a (population, path_length) matrix, one block of rows per Numba thread.
+
+    A single path, a single Numba thread, or a call from any thread but the main one is simulated on
+    the calling thread without launching a parallel region. The workqueue threading layer aborts when
+    parallel regions are launched from several threads at once, and TBB hangs at exit once it was
+    started off the main thread.
+
+    Args:
+        paths: int8 matrix of direction codes, one row per path
+        walls: Flat row-major uint8 array of the (rows + 2, cols + 2) wall grid with a wall border
+        rows: Number of maze rows
+        cols: Number of maze columns
+        start_row: Starting row
+        start_col: Starting column
+        end_row: Goal row
+        end_col: Goal column
+
+    Returns:
+        int64 array of shape (population, 6), one row of
+        (collisions, final_row, final_col, path_length, unique_cells_visited, reached) per path
+    """
+    # get_num_threads() starts the threading layer, so other threads must not reach it
+    if threading.current_thread() is not threading.main_thread() or paths.shape[0] <= 1:
+        return _simulate_rows(paths, walls, rows, cols, start_row, start_col, end_row, end_col)
+    n_blocks = min(get_num_threads(), paths.shape[0])
+    if n_blocks <= 1:
+        return _simulate_rows(paths, walls, rows, cols, start_row, start_col, end_row, end_col)
+    return _simulate_blocks(paths, walls, rows, cols, start_row, start_col, end_row, end_col, n_blocks)
+
+
+@njit(cache=True, nogil=True)
+def trace_path(
+    path: np.ndarray,
+    walls: np.ndarray,
+    rows: int,
+    cols: int,
+    start_row: int,
+    start_col: int,
+    end_row: int,
+    end_col: int,
+) -> np.ndarray:
+    """Run `simulate` on a single path and return the route it walks.
+
+    Arguments are as for `simulate_population`.
+
+    Returns:
+        int64 array of the flat row-major indices of the cells stepped on, starting with the start cell
+    """
+    stride = cols + 2
+    visited = np.zeros((rows + 2) * stride, dtype=np.int64)
+    trace = np.empty(path.shape[0] + 1, dtype=np.int64)
+    start_cell = (start_row + 1) * stride + start_col + 1
+    end_cell = (end_row + 1) * stride + end_col + 1
+    path_length = simulate(path, walls, DR * stride + DC, start_cell, end_cell, visited, 1, trace)[2]
+    route = trace[:path_length]
+    return (route // stride - 1) * cols + route % stride - 1
+
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def simplify_pad(paths: np.ndarray, padding: np.ndarray) -> np.ndarray:
+    """Cancel opposite moves in every row of a (population, path_length) matrix and pad the rows back.
+
+    Args:
+        paths: int8 matrix of direction codes
+        padding: int8 matrix of random direction codes, one row per path, as wide as the result
+
+    Returns:
+        int8 matrix shaped like `padding` holding each simplified path followed by the remaining
+        columns of its padding row, truncated if a simplified path is wider than `padding`
+    """
+    result = padding.copy()
+    width = padding.shape[1]
+    stack = np.empty(paths.shape[1], dtype=np.int8)
+    for i in range(paths.shape[0]):
+        size = 0
+        for j in range(paths.shape[1]):
+            code = paths[i, j]
+            # Opposite codes differ only in the lowest bit
+            if size > 0 and stack[size - 1] ^ 1 == code:
+                size -= 1
+            else:
+                stack[size] = code
+                size += 1
+        result[i, : min(size, width)] = stack[: min(size, width)]
+    return result
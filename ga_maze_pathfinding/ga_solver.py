@@ -1,13 +1,57 @@
 """Genetic Algorithm solver for maze pathfinding using DEAP."""
 
 import random
+from collections import OrderedDict
 from collections.abc import Sequence
-from typing import Any
+from multiprocessing import get_context, shared_memory
+from multiprocessing.pool import Pool
+from types import TracebackType
+from typing import Any, Self
 
+import numpy as np
 from deap import base, creator, tools
+from numba import set_num_threads
 
+from ga_maze_pathfinding._kernels import simplify_pad, simulate_population, trace_path
 from ga_maze_pathfinding.maze import Direction, Maze, Position
 
+# Directions indexed by their code
+_DIRS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+
+# Fitness (minimize the sum of the collision/distance penalty and path length) and individual classes,
+# created once per process so repeated solver construction reuses them
+if not hasattr(creator, "FitnessMin"):
+    creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+if not hasattr(creator, "Individual"):
+    creator.create("Individual", np.ndarray, fitness=creator.FitnessMin)
+
+
+# Maze arrays of a pool worker process, set once by `_init_worker`
+_worker_maze: tuple[np.ndarray, tuple[int, int], Position, Position] | None = None
+# Shared memory block backing the worker's wall grid, kept open for the lifetime of the worker
+_worker_shm: shared_memory.SharedMemory | None = None
+
+
+def _init_worker(shm_name: str, shape: tuple[int, int], start: Position, end: Position) -> None:
+    """Initialize a pool worker with a view of the shared wall grid.
+
+    Each worker simulates its chunk on a single Numba thread, since the pool already spreads chunks over the cores.
+    Workers only simulate paths and draw no random numbers, so they need no seed.
+    """
+    global _worker_maze, _worker_shm
+    set_num_threads(1)
+    _worker_shm = shared_memory.SharedMemory(name=shm_name, track=False)
+    walls = np.ndarray((shape[0] + 2) * (shape[1] + 2), dtype=np.uint8, buffer=_worker_shm.buf)
+    walls.flags.writeable = False
+    _worker_maze = (walls, shape, start, end)
+
+
+def _simulate_chunk(paths: np.ndarray) -> np.ndarray:
+    """Simulate a chunk of the population inside a pool worker."""
+    assert _worker_maze is not None, "Worker was not initialized"
+    walls, shape, start, end = _worker_maze
+    return simulate_population(paths, walls, *shape, *start, *end)
+
 
 class GASolver:
     """Genetic Algorithm solver for maze pathfinding."""
@@ -23,6 +67,8 @@ class GASolver:
         tournament_size: int = 3,
         early_stopping_generations: int = 20,
         early_stopping_min_change: float = 0.001,
+        n_workers: int | None = None,
+        target_path_length: int | None = None,
     ):
         """Initialize the GA solver.
 
@@ -36,8 +82,11 @@ class GASolver:
             tournament_size: Tournament size for selection
             early_stopping_generations: Number of generations without improvement to trigger early stopping
             early_stopping_min_change: Minimum fitness change to consider as improvement
+            n_workers: Number of worker processes evaluating fitness in parallel (None or 1 evaluates serially)
+            target_path_length: Stop as soon as a path of at most this length (as reported in the fitness)
+                reaches the goal without collisions or revisits. Defaults to the shortest possible length,
+                so only a provably optimal path stops the evolution early.
         """
-        self.maze = maze
         self.population_size = population_size
         self.max_generations = max_generations
         self.max_path_length = max_path_length
@@ -46,167 +95,374 @@ class GASolver:
         self.tournament_size = tournament_size
         self.early_stopping_generations = early_stopping_generations
         self.early_stopping_min_change = early_stopping_min_change
+        self.n_workers = n_workers or 1
+
+        # Vectorized random generator, seeded from `random` so that seeding it keeps runs reproducible
+        self._rng = np.random.default_rng(random.getrandbits(64))
+
+        # Fitness of recently evaluated paths, keyed by their packed direction codes, least recently used first
+        self._fitness_cache: OrderedDict[bytes, tuple[float]] = OrderedDict()
+        self._fitness_cache_size = 10 * population_size
+
+        # Worker pool for parallel fitness evaluation, reading the wall grid from shared memory
+        self._pool: Pool | None = None
+        self._shm: shared_memory.SharedMemory | None = None
+
+        # Explicit early stopping target; None derives it from each maze the solver is given
+        self._target_path_length_arg = target_path_length
+
+        self.maze = maze
+
+        if self.n_workers > 1:
+            self._shm = shared_memory.SharedMemory(create=True, size=self._walls.nbytes)
+            np.ndarray(self._walls.shape, dtype=np.uint8, buffer=self._shm.buf)[:] = self._walls
+            self._pool = get_context("forkserver").Pool(
+                processes=self.n_workers,
+                initializer=_init_worker,
+                initargs=(self._shm.name, self._shape, maze.start, maze.end),
+            )
 
         # Setup DEAP
         self._setup_deap()
 
-    def _setup_deap(self) -> None:
-        """Setup DEAP creator and toolbox."""
-        # Clear any existing fitness and individual classes
-        if hasattr(creator, "FitnessMin"):
-            del creator.FitnessMin
-        if hasattr(creator, "Individual"):
-            del creator.Individual
+    @property
+    def maze(self) -> Maze:
+        """The maze being solved."""
+        return self._maze
 
-        # Create fitness (minimize both collisions and distance)
-        creator.create("FitnessMin", base.Fitness, weights=(-1.0, -1.0))
-        creator.create("Individual", list, fitness=creator.FitnessMin)
+    @maze.setter
+    def maze(self, maze: Maze) -> None:
+        """Replace the maze, rebuilding the arrays derived from it and dropping cached fitness values.
 
-        self.toolbox = base.Toolbox()
+        The default `target_path_length` is recomputed for the new maze; an explicit target is kept.
+
+        Raises:
+            RuntimeError: If worker processes holding the previous maze are running; `close()` the solver first
+        """
+        if self._pool is not None:
+            raise RuntimeError("Cannot replace the maze while the worker pool is running; call close() first")
+
+        self._maze = maze
+        self._fitness_cache.clear()
+
+        # Flat row-major wall grid with a wall border, used by the compiled simulator
+        self._walls = maze.walls_padded.ravel()
+        self._shape = (maze.rows, maze.cols)
 
-        # Attribute generator - random direction
-        directions = [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]
-        self.toolbox.register("attr_direction", random.choice, directions)
-
-        # Structure initializers
-        self.toolbox.register(
-            "individual",
-            tools.initRepeat,
-            creator.Individual,
-            self.toolbox.attr_direction,
-            n=self.max_path_length,
+        # Shortest-path distance to the goal from every cell, falling back to the Manhattan distance
+        # for cells the goal cannot be reached from
+        self._distance_to_goal = np.where(maze.goal_dist >= 0, maze.goal_dist, maze.manhattan_field)
+
+        # Default target: the shortest possible path to the goal in this maze
+        self.target_path_length = (
+            self._target_path_length_arg
+            if self._target_path_length_arg is not None
+            else int(self._distance_to_goal[maze.start]) + 1
         )
-        self.toolbox.register("population", tools.initRepeat, list, self.toolbox.individual)
+
+    def __enter__(self) -> Self:
+        """Enter the context, returning the solver itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the context, shutting down the worker pool."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool and release its shared memory, if any."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def _setup_deap(self) -> None:
+        """Setup DEAP toolbox."""
+        self.toolbox = base.Toolbox()
+        if self._pool is not None:
+            self.toolbox.register("map", self._pool.map)
+
+        # Structure initializers - individuals are int8 arrays of direction codes
+        self.toolbox.register("individual", self._init_individual)
+        self.toolbox.register("population", self._init_population)
+        self.toolbox.register("clone", self._clone_individual)
+        self.toolbox.register("clone_batch", self._clone_population)
 
         # Genetic operators
         self.toolbox.register("evaluate", self._evaluate_individual)
+        self.toolbox.register("evaluate_batch", self._evaluate_population)
         self.toolbox.register("mate", self._crossover_individuals)
+        self.toolbox.register("mate_batch", self._crossover_population)
         self.toolbox.register("mutate", self._mutate_individual, indpb=0.2)
-        self.toolbox.register("select", tools.selTournament, tournsize=self.tournament_size)
+        self.toolbox.register("mutate_batch", self._mutate_population, indpb=0.2)
+        self.toolbox.register("simplify_batch", self._simplify_population)
+        self.toolbox.register("select", self._select_tournament, tournsize=self.tournament_size)
 
-    def _evaluate_individual(self, individual: Sequence[Direction]) -> tuple[float, float]:
+    def _init_individual(self) -> Any:
+        """Create an individual of `max_path_length` random direction codes."""
+        return creator.Individual(self._rng.integers(0, len(_DIRS), size=self.max_path_length, dtype=np.int8))
+
+    def _init_population(self, n: int) -> list[Any]:
+        """Create n individuals from a single (n, max_path_length) draw of random direction codes.
+
+        Each individual is a row view of the drawn matrix; variation only modifies rows in place,
+        so the rows are never modified through each other.
+        """
+        codes = self._rng.integers(0, len(_DIRS), size=(n, self.max_path_length), dtype=np.int8)
+        population = list(codes.view(creator.Individual))
+        for individual in population:
+            individual.fitness = creator.FitnessMin()
+        return population
+
+    def _greedy_path(self) -> np.ndarray:
+        """Build a path that greedily walks toward the goal.
+
+        At every step a random open direction that reduces the Manhattan distance to the goal is taken,
+        falling back to any open direction when none does, and to any direction when boxed in.
+
+        Returns:
+            int8 array of `max_path_length` direction codes
+        """
+        codes = np.empty(self.max_path_length, dtype=np.int8)
+        # The padded grid makes every neighbour of an in-bounds cell a valid index
+        walls = self.maze.walls_padded
+        end_row, end_col = self.maze.end
+        row, col = self.maze.start
+        for i in range(self.max_path_length):
+            moves = [(direction, *self.maze.move_rc(row, col, direction)) for direction in _DIRS]
+            open_moves = [move for move in moves if not walls[move[1] + 1, move[2] + 1]]
+            distance = abs(row - end_row) + abs(col - end_col)
+            closer = [move for move in open_moves if abs(move[1] - end_row) + abs(move[2] - end_col) < distance]
+            direction, new_row, new_col = random.choice(closer or open_moves or moves)  # noqa: S311
+            codes[i] = direction
+            if not walls[new_row + 1, new_col + 1]:
+                row, col = new_row, new_col
+        return codes
+
+    def _seed_population(self, population: list[Any], indpb: float = 0.05) -> None:
+        """Replace the first tenth of the population with slightly mutated greedy paths.
+
+        Args:
+            population: Freshly initialized population, modified in place
+            indpb: Probability of mutating each gene of a greedy path
+        """
+        for i in range(len(population) // 10):
+            individual = creator.Individual(self._greedy_path())
+            self.toolbox.mutate(individual, indpb=indpb)
+            population[i] = individual
+
+    def _clone_individual(self, individual: Any) -> Any:
+        """Copy an individual and its fitness."""
+        return self._clone_population([individual])[0]
+
+    def _clone_population(self, individuals: Sequence[Any]) -> list[Any]:
+        """Copy many individuals with a single (n, path_length) array copy.
+
+        The clones are row views of the new matrix and carry copies of their parents' fitness values.
+        """
+        codes = np.array(individuals, dtype=np.int8)
+        clones = list(codes.view(creator.Individual))
+        for clone, individual in zip(clones, individuals, strict=True):
+            clone.fitness = creator.FitnessMin()
+            clone.fitness.wvalues = individual.fitness.wvalues
+        return clones
+
+    def _evaluate_individual(self, individual: Sequence[Direction]) -> tuple[float]:
         """Evaluate an individual (path) in the maze.
 
+        Returns:
+            Single-value tuple with the sum of both objectives (see `_evaluate_objectives`).
+            We want to minimize it.
+        """
+        return self._evaluate_population([individual])[0]
+
+    def _evaluate_objectives(self, individual: Sequence[Direction]) -> tuple[float, float]:
+        """Evaluate the objectives an individual's fitness is made of.
+
         Returns:
             Tuple of (collisions + out_of_bounds, effective_distance)
             We want to minimize both values.
         """
-        position = self.maze.start
-        collisions = 0
-        visited_positions = [position]
-        unique_positions = {position}  # Track unique positions explored
-
-        # Simulate the path
-        for direction in individual:
-            new_position = self.maze.move(position, direction)
-
-            # Check if hit wall or out of bounds
-            if self.maze.is_wall(new_position) or not self.maze.is_valid_position(new_position):
-                collisions += 1
-                # Don't move if hit wall
-            else:
-                position = new_position
-                visited_positions.append(position)
-                unique_positions.add(position)
-
-            # Early stop if reached goal
-            if position == self.maze.end:
-                break
-
-        # Calculate distance to goal from final position
-        distance_to_goal = self.maze.manhattan_distance(position)
-
-        # Calculate exploration score (number of unique cells visited)
-        unique_cells_visited = len(unique_positions)
-
-        # Calculate revisit penalty (encourages exploring new cells)
-        revisit_penalty = len(visited_positions) - unique_cells_visited
-
-        # Penalty for collisions and distance
-        # Also consider path length - shorter paths are better if they reach goal
-        if position == self.maze.end:
-            # Reached goal: minimize collisions and actual path length
-            path_length = len(visited_positions)
-            # Reward: fewer collisions, shorter path, less revisiting
-            fitness = (collisions * 10 + revisit_penalty * 2, path_length)
-        else:
-            # Did not reach goal: heavily penalize distance to goal and collisions
-            # But reward exploring more unique cells
-            exploration_bonus = -unique_cells_visited  # Negative because we're minimizing
-            fitness = (
-                collisions * 10 + distance_to_goal * 5 + revisit_penalty * 2 + exploration_bonus,
-                self.max_path_length,
-            )
+        penalty, path_length = self._compute_objectives(np.asarray([individual], dtype=np.int8), parallel=False)
+        return penalty.item(), path_length.item()
 
-        return fitness
+    def _evaluate_population(self, population: Sequence[Sequence[Direction]]) -> list[tuple[float]]:
+        """Evaluate all individuals at once.
 
-    def _crossover_individuals(self, ind1: Any, ind2: Any) -> tuple[Any, Any]:
-        """Crossover two individuals and simplify the offspring.
+        Individuals are stacked into a (population, path_length) matrix of direction codes.
+        Paths already in the fitness cache are not simulated again, and identical paths within
+        the population are simulated once and share the result.
 
         Args:
-            ind1: First parent
-            ind2: Second parent
+            population: Individuals to evaluate, all of the same length
 
         Returns:
-            Tuple of two offspring
+            List of fitness tuples, one per individual (see `_evaluate_individual`)
         """
-        # Perform two-point crossover
-        tools.cxTwoPoint(ind1, ind2)
+        if len(population) == 0:
+            return []
+
+        paths = np.asarray(population, dtype=np.int8)
+        keys = self._cache_keys(paths)
+        fitnesses = {}
+        for key in keys:
+            if key in self._fitness_cache:
+                fitnesses[key] = self._fitness_cache[key]
+                self._fitness_cache.move_to_end(key)
+
+        # One representative row per distinct uncached path
+        missing = list({key: i for i, key in enumerate(keys) if key not in fitnesses}.values())
+        if missing:
+            for i, fitness in zip(missing, self._compute_fitness(paths[missing]), strict=True):
+                fitnesses[keys[i]] = fitness
+                self._fitness_cache[keys[i]] = fitness
+
+            # Evict the least recently used entries
+            while len(self._fitness_cache) > self._fitness_cache_size:
+                self._fitness_cache.popitem(last=False)
+
+        return [fitnesses[key] for key in keys]
+
+    @staticmethod
+    def _cache_keys(paths: np.ndarray) -> list[bytes]:
+        """Build fitness cache keys by packing the direction codes of each path at 2 bits per gene.
 
-        # Simplify both offspring
-        simplified1 = self._simplify_individual(ind1)
-        simplified2 = self._simplify_individual(ind2)
+        Args:
+            paths: int8 matrix of direction codes, one row per individual
 
-        # Pad back to max_path_length
-        ind1[:] = self._pad_individual(simplified1, self.max_path_length)
-        ind2[:] = self._pad_individual(simplified2, self.max_path_length)
+        Returns:
+            List of keys, one per row, prefixed with the path length so paths of different lengths never collide
+        """
+        n_paths, length = paths.shape
+        codes = np.zeros((n_paths, -(-length // 4) * 4), dtype=np.uint8)
+        codes[:, :length] = paths
+        packed = codes[:, 0::4] | codes[:, 1::4] << 2 | codes[:, 2::4] << 4 | codes[:, 3::4] << 6
+        prefix = length.to_bytes(4, "little")
+        return [prefix + row.tobytes() for row in packed]
 
-        return ind1, ind2
+    def _compute_fitness(self, paths: np.ndarray) -> list[tuple[float]]:
+        """Score a (population, path_length) matrix of direction codes.
 
-    def _simplify_individual(self, individual: Any) -> list[Direction]:
-        """Simplify an individual by removing opposite move cancellations.
+        Args:
+            paths: int8 matrix of direction codes, one row per individual
 
-        For example: UP, DOWN, DOWN -> DOWN
-                     LEFT, RIGHT -> (empty)
-                     UP, UP, DOWN -> UP
+        Returns:
+            List of single-value fitness tuples, one per row
+        """
+        penalty, path_length = self._compute_objectives(paths)
+        return [(fitness,) for fitness in (penalty + path_length).tolist()]
+
+    def _compute_objectives(self, paths: np.ndarray, parallel: bool = True) -> tuple[np.ndarray, np.ndarray]:
+        """Simulate a (population, path_length) matrix of direction codes and score both objectives with NumPy.
 
         Args:
-            individual: The individual to simplify
+            paths: int8 matrix of direction codes, one row per individual
+            parallel: Whether to split the paths over the worker pool, if any. Single paths are
+                cheaper to simulate in this process than to send to a worker.
 
         Returns:
-            Simplified list of directions
+            Tuple of (penalty, path_length) arrays, one value per row
         """
-        opposites = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT,
-        }
+        if self._pool is None or not parallel:
+            results = simulate_population(paths, self._walls, *self._shape, *self.maze.start, *self.maze.end)
+        else:
+            chunks = np.array_split(paths, self.n_workers)
+            results = np.concatenate(list(self.toolbox.map(_simulate_chunk, chunks)))
+        collisions, final_row, final_col, path_length, unique_cells_visited, reached = results.T
+        reached = reached.astype(bool)
+
+        distance_to_goal = self._distance_to_goal[final_row, final_col]
+        revisit_penalty = path_length - unique_cells_visited
+
+        # Reached goal: minimize collisions and actual path length.
+        # Did not reach goal: heavily penalize distance to goal and collisions,
+        # but reward exploring more unique cells.
+        base_penalty = collisions * 10 + revisit_penalty * 2
+        first = np.where(reached, base_penalty, base_penalty + distance_to_goal * 5 - unique_cells_visited)
+        second = np.where(reached, path_length, self.max_path_length)
+
+        return first, second
+
+    def _select_tournament(self, individuals: Sequence[Any], k: int, tournsize: int) -> list[Any]:
+        """Select k individuals by running all tournaments at once with NumPy.
+
+        Equivalent to `tools.selTournament`: the first of equally fit aspirants wins.
 
-        simplified: list[Direction] = []
-        for direction in individual:
-            # If the last move is opposite to current, they cancel out
-            if simplified and simplified[-1] == opposites[direction]:
-                simplified.pop()
-            else:
-                simplified.append(direction)
+        Args:
+            individuals: Individuals to select from
+            k: Number of individuals to select
+            tournsize: Number of aspirants in each tournament
 
-        return simplified
+        Returns:
+            List of selected individuals
+        """
+        fitnesses = np.array([ind.fitness.values[0] for ind in individuals])
+        aspirants = self._rng.integers(0, len(individuals), size=(k, tournsize))
+        winners = aspirants[np.arange(k), fitnesses[aspirants].argmin(axis=1)]
+        return [individuals[i] for i in winners.tolist()]
 
-    def _pad_individual(self, individual: list[Direction], target_length: int) -> list[Direction]:
-        """Pad an individual to target length with random directions.
+    def _crossover_individuals(self, ind1: Any, ind2: Any) -> tuple[Any, Any]:
+        """Crossover two individuals.
 
         Args:
-            individual: The individual to pad
-            target_length: Desired length
+            ind1: First parent
+            ind2: Second parent
 
         Returns:
-            Padded individual
+            Tuple of two offspring
+        """
+        self._crossover_population([ind1], [ind2])
+        return ind1, ind2
+
+    def _crossover_population(self, parents1: Sequence[Any], parents2: Sequence[Any]) -> None:
+        """Two-point crossover of many pairs at once.
+
+        The parents are stacked into two (pairs, path_length) matrices and all pairs
+        swap their middle segments with a single masked select. Parents are replaced
+        in place by their offspring.
+
+        Args:
+            parents1: First parent of each pair
+            parents2: Second parent of each pair, all of the same length as `parents1`
+        """
+        first = np.asarray(parents1, dtype=np.int8)
+        second = np.asarray(parents2, dtype=np.int8)
+        n_pairs, length = first.shape
+
+        # Two distinct crossover points per pair in [1, length], as in tools.cxTwoPoint
+        cxpoint1 = self._rng.integers(1, length + 1, size=n_pairs)
+        cxpoint2 = self._rng.integers(1, length, size=n_pairs)
+        cxpoint2 += cxpoint2 >= cxpoint1
+        genes = np.arange(length)
+        swapped = (genes >= np.minimum(cxpoint1, cxpoint2)[:, None]) & (genes < np.maximum(cxpoint1, cxpoint2)[:, None])
+        offspring = np.concatenate([np.where(swapped, second, first), np.where(swapped, first, second)])
+
+        for individual, codes in zip([*parents1, *parents2], offspring, strict=True):
+            individual[:] = codes
+
+    def _simplify_population(self, individuals: Sequence[Any]) -> None:
+        """Simplify individuals in place and pad them back to `max_path_length` in one compiled pass.
+
+        Crossover and mutation leave simplification to this step, which runs once on every changed
+        offspring right before evaluation, so offspring that are both crossed and mutated are simplified once.
+
+        Args:
+            individuals: Individuals of equal length to simplify
         """
-        directions = [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]
-        while len(individual) < target_length:
-            individual.append(random.choice(directions))  # noqa: S311
-        return individual
+        if not individuals:
+            return
+        codes = np.asarray(individuals, dtype=np.int8)
+        padding = self._rng.integers(0, len(_DIRS), size=(len(codes), self.max_path_length), dtype=np.int8)
+        for individual, simplified in zip(individuals, simplify_pad(codes, padding), strict=True):
+            individual[:] = simplified
 
     def _mutate_individual(self, individual: Any, indpb: float) -> tuple[Any]:
         """Mutate an individual by randomly changing some directions.
@@ -218,17 +474,31 @@ class GASolver:
         Returns:
             Tuple containing the mutated individual
         """
-        directions = [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]
-        for i in range(len(individual)):
-            if random.random() < indpb:  # noqa: S311
-                individual[i] = random.choice(directions)  # noqa: S311
-
-        # Simplify after mutation to remove redundant moves
-        simplified = self._simplify_individual(individual)
-        individual[:] = self._pad_individual(simplified, self.max_path_length)
+        self._mutate_population([individual], indpb)
 
         return (individual,)
 
+    def _mutate_population(self, individuals: Sequence[Any], indpb: float) -> None:
+        """Mutate many individuals at once, replacing them in place.
+
+        The individuals are stacked into one (individuals, path_length) matrix, so a whole
+        generation of mutants draws its mask and its new directions in two calls on the
+        solver's generator.
+
+        Args:
+            individuals: Individuals to mutate, all of the same length
+            indpb: Independent probability for each attribute to be mutated
+        """
+        if not individuals:
+            return
+
+        codes = np.array(individuals, dtype=np.int8)
+        mutated = self._rng.random(codes.shape) < indpb
+        codes[mutated] = self._rng.integers(0, len(_DIRS), size=np.count_nonzero(mutated), dtype=np.int8)
+
+        for individual, row in zip(individuals, codes, strict=True):
+            individual[:] = row
+
     def _ea_simple_with_early_stopping(
         self,
         population: list[Any],
@@ -236,7 +506,7 @@ class GASolver:
         cxpb: float,
         mutpb: float,
         ngen: int,
-        stats: tools.Statistics,
+        stats: bool,
         halloffame: tools.HallOfFame,
         verbose: bool = True,
     ) -> tuple[list[Any], tools.Logbook]:
@@ -248,7 +518,7 @@ class GASolver:
             cxpb: Crossover probability
             mutpb: Mutation probability
             ngen: Maximum number of generations
-            stats: Statistics object
+            stats: Whether to record fitness statistics (see `_record_stats`) in the logbook
             halloffame: Hall of fame to track best individuals
             verbose: Whether to print progress
 
@@ -256,17 +526,17 @@ class GASolver:
             Tuple of (final_population, logbook)
         """
         logbook = tools.Logbook()
-        logbook.header = ["gen", "nevals"] + (stats.fields if stats else [])
+        logbook.header = ["gen", "nevals"] + (["avg", "min", "max"] if stats else [])
 
         # Evaluate the initial population
-        fitnesses = map(toolbox.evaluate, population)
+        fitnesses = toolbox.evaluate_batch(population)
         for ind, fit in zip(population, fitnesses, strict=False):
             ind.fitness.values = fit
 
         if halloffame is not None:
             halloffame.update(population)
 
-        record = stats.compile(population) if stats else {}
+        record = self._record_stats(population) if stats else {}
         logbook.record(gen=0, nevals=len(population), **record)
         if verbose:
             print(logbook.stream)  # noqa: T201
@@ -275,27 +545,42 @@ class GASolver:
         best_fitness_history: list[float] = []
         generations_without_improvement = 0
 
+        # Hall of fame entry last checked against the target; a new best is a new object
+        checked_best = None
+
         # Evolution loop
         for gen in range(1, ngen + 1):
+            # Stop as soon as the best path is good enough, simulating it only when it changed
+            if halloffame is not None and halloffame[0] is not checked_best:
+                checked_best = halloffame[0]
+                if self._is_target_reached(self._evaluate_objectives(checked_best)):
+                    if verbose:
+                        print(f"\nTarget path found at generation {gen - 1}")  # noqa: T201
+                    break
+
             # Select the next generation individuals
             offspring = toolbox.select(population, len(population))
-            offspring = list(map(toolbox.clone, offspring))
+            offspring = toolbox.clone_batch(offspring)
+
+            # Draw which pairs mate and which individuals mutate in one call each
+            mating = (np.flatnonzero(self._rng.random(len(offspring) // 2) < cxpb) * 2 + 1).tolist()
+            mutants = np.flatnonzero(self._rng.random(len(offspring)) < mutpb).tolist()
 
-            # Apply crossover and mutation
-            for i in range(1, len(offspring), 2):
-                if random.random() < cxpb:  # noqa: S311
-                    offspring[i - 1], offspring[i] = toolbox.mate(offspring[i - 1], offspring[i])
+            # Apply crossover to all mating pairs at once, then mutation
+            if mating:
+                toolbox.mate_batch([offspring[i - 1] for i in mating], [offspring[i] for i in mating])
+                for i in mating:
                     del offspring[i - 1].fitness.values
                     del offspring[i].fitness.values
 
-            for i in range(len(offspring)):
-                if random.random() < mutpb:  # noqa: S311
-                    (offspring[i],) = toolbox.mutate(offspring[i])
-                    del offspring[i].fitness.values
+            toolbox.mutate_batch([offspring[i] for i in mutants])
+            for i in mutants:
+                del offspring[i].fitness.values
 
-            # Evaluate individuals with invalid fitness
+            # Simplify and evaluate individuals with invalid fitness
             invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
-            fitnesses = map(toolbox.evaluate, invalid_ind)
+            toolbox.simplify_batch(invalid_ind)
+            fitnesses = toolbox.evaluate_batch(invalid_ind)
             for ind, fit in zip(invalid_ind, fitnesses, strict=False):
                 ind.fitness.values = fit
 
@@ -307,7 +592,7 @@ class GASolver:
             population[:] = offspring
 
             # Record statistics
-            record = stats.compile(population) if stats else {}
+            record = self._record_stats(population) if stats else {}
             logbook.record(gen=gen, nevals=len(invalid_ind), **record)
             if verbose:
                 print(logbook.stream)  # noqa: T201
@@ -331,6 +616,28 @@ class GASolver:
 
         return population, logbook
 
+    @staticmethod
+    def _record_stats(population: Sequence[Any]) -> dict[str, float]:
+        """Compute the average, minimum and maximum fitness of a population from one fitness array.
+
+        Args:
+            population: Evaluated individuals
+
+        Returns:
+            Dictionary with "avg", "min" and "max" fitness
+        """
+        fitnesses = np.fromiter((ind.fitness.values[0] for ind in population), dtype=np.float64, count=len(population))
+        return {"avg": float(fitnesses.mean()), "min": float(fitnesses.min()), "max": float(fitnesses.max())}
+
+    def _is_target_reached(self, objectives: Sequence[float]) -> bool:
+        """Check if objectives belong to a path reaching the goal within `target_path_length`.
+
+        Paths that miss the goal always report `max_path_length` as their length,
+        so only lengths below it are trusted.
+        """
+        collision_penalty, path_length = objectives
+        return collision_penalty == 0 and path_length <= min(self.target_path_length, self.max_path_length - 1)
+
     def solve(self, verbose: bool = True) -> tuple[list[Direction], dict]:
         """Solve the maze using genetic algorithm.
 
@@ -340,17 +647,12 @@ class GASolver:
         Returns:
             Tuple of (best_path, statistics_dict)
         """
-        # Create initial population
+        # Create initial population, warm-started with greedy paths toward the goal
         population = self.toolbox.population(n=self.population_size)
-
-        # Statistics
-        stats = tools.Statistics(lambda ind: ind.fitness.values)
-        stats.register("avg", lambda x: sum(f[0] + f[1] for f in x) / len(x))
-        stats.register("min", lambda x: min(f[0] + f[1] for f in x))
-        stats.register("max", lambda x: max(f[0] + f[1] for f in x))
+        self._seed_population(population)
 
         # Hall of fame to keep track of best individuals
-        hof = tools.HallOfFame(1)
+        hof = tools.HallOfFame(1, similar=np.array_equal)
 
         if verbose:
             print(f"Starting GA with population={self.population_size}, generations={self.max_generations}")  # noqa: T201
@@ -368,7 +670,7 @@ class GASolver:
             cxpb=self.crossover_prob,
             mutpb=self.mutation_prob,
             ngen=self.max_generations,
-            stats=stats,
+            stats=True,
             halloffame=hof,
             verbose=verbose,
         )
@@ -376,55 +678,60 @@ class GASolver:
         # Get the best individual
         best_individual = hof[0]
         best_fitness = best_individual.fitness.values
+        best_objectives = self._evaluate_objectives(best_individual)
+        best_trace = self._trace(best_individual)
 
         if verbose:
-            print(f"\nBest fitness: {best_fitness}")  # noqa: T201
-            print(f"Collisions/Distance penalty: {best_fitness[0]}")  # noqa: T201
-            print(f"Path length: {best_fitness[1]}")  # noqa: T201
+            print(f"\nBest fitness: {best_fitness[0]}")  # noqa: T201
+            print(f"Collisions/Distance penalty: {best_objectives[0]}")  # noqa: T201
+            print(f"Path length: {best_objectives[1]}")  # noqa: T201
 
         # Extract statistics
         stats_dict = {
             "best_fitness": best_fitness,
+            "best_objectives": best_objectives,
             "best_individual": best_individual,
+            "best_trace": best_trace,
             "logbook": logbook,
             "final_population": population,
         }
 
-        return list(best_individual), stats_dict
+        return [Direction(code) for code in best_individual.tolist()], stats_dict
 
-    def visualize_path(self, path: list[Direction]) -> str:
-        """Visualize the path on the maze.
+    def _trace(self, path: Sequence[Direction]) -> list[Position]:
+        """Walk a path through the maze with the compiled simulator.
 
         Args:
-            path: List of directions
+            path: Sequence of directions
 
         Returns:
-            String representation of maze with path
+            Positions stepped on in order, starting at the maze start and stopping at the goal if reached
         """
-        # Create a copy of the grid for visualization
-        vis_grid = [row[:] for row in self.maze.grid]
+        codes = np.asarray(path, dtype=np.int8)
+        cells = trace_path(codes, self._walls, *self._shape, *self.maze.start, *self.maze.end)
+        return [Position(*divmod(cell, self.maze.cols)) for cell in cells.tolist()]
 
-        position = self.maze.start
-        path_positions = [position]
-
-        # Trace the path
-        for direction in path:
-            new_position = self.maze.move(position, direction)
+    def visualize_path(self, path: list[Direction], trace: list[Position] | None = None) -> str:
+        """Visualize the path on the maze.
 
-            # Only move if valid
-            if not self.maze.is_wall(new_position) and self.maze.is_valid_position(new_position):
-                position = new_position
-                path_positions.append(position)
+        Args:
+            path: List of directions
+            trace: Positions walked by `path`, such as `stats_dict["best_trace"]` from `solve`;
+                computed from `path` when omitted
 
-            # Stop if reached goal
-            if position == self.maze.end:
-                break
+        Returns:
+            String representation of maze with path
+        """
+        if trace is None:
+            trace = self._trace(path)
+        path_positions = set(trace)
+        path_length = len(trace)
 
         # Mark path positions
         result = []
-        for i, row in enumerate(vis_grid):
+        for i, row in enumerate(self.maze.wall.tolist()):
             row_str = []
-            for j, cell in enumerate(row):
+            for j, wall in enumerate(row):
                 pos = Position(i, j)
                 if pos == self.maze.start:
                     row_str.append("S")
@@ -432,7 +739,7 @@ class GASolver:
                     row_str.append("E")
                 elif pos in path_positions:
                     row_str.append("*")
-                elif cell == 1:  # Wall
+                elif wall:
                     row_str.append("█")
                 else:
                     row_str.append(".")
@@ -440,7 +747,7 @@ class GASolver:
 
         # Add legend
         result.append("\nLegend: S=Start, E=End, *=Path, █=Wall, .=Empty")
-        result.append(f"Path length: {len(path_positions)} steps")
-        result.append(f"Reached goal: {position == self.maze.end}")
+        result.append(f"Path length: {path_length} steps")
+        result.append(f"Reached goal: {trace[-1] == self.maze.end}")
 
         return "\n".join(result)
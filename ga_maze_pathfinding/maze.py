@@ -1,8 +1,11 @@
 """Maze representation and utilities."""
 
-from enum import Enum
+from collections import deque
+from enum import Enum, IntEnum
 from typing import NamedTuple
 
+import numpy as np
+
 
 class Cell(Enum):
     """Cell types in the maze."""
@@ -13,6 +16,10 @@ class Cell(Enum):
     END = 3
 
 
+# Grid value of a wall cell
+_WALL = Cell.WALL.value
+
+
 class Position(NamedTuple):
     """Position in the maze grid."""
 
@@ -20,13 +27,26 @@ class Position(NamedTuple):
     col: int
 
 
-class Direction(Enum):
-    """Movement directions."""
+class Direction(IntEnum):
+    """Movement directions.
+
+    Values are small integer codes so that paths can be stored as compact int8 arrays.
+    Opposite directions differ only in the lowest bit, so `code ^ 1` is the opposite direction.
+    """
+
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+
+    @property
+    def label(self) -> str:
+        """Single-letter label of the direction (U, D, L, R)."""
+        return self.name[0]
 
-    UP = "U"
-    DOWN = "D"
-    LEFT = "L"
-    RIGHT = "R"
+
+# (row, column) delta of each direction, indexed by its code
+DIR_DELTAS = ((-1, 0), (1, 0), (0, -1), (0, 1))
 
 
 class Maze:
@@ -45,47 +65,93 @@ class Maze:
         self.cols = len(grid[0]) if grid else 0
         self.start = start
         self.end = end
+        # Contiguous uint8 grid where 1 marks a wall
+        self.wall = np.ascontiguousarray(np.asarray(grid).reshape(self.rows, self.cols) == _WALL, dtype=np.uint8)
+        # Mazes of up to 64 cells also pack their walls into one machine-word int, bit row * cols + col
+        # set for a wall; larger ones would need a bigint shifted on every lookup and use `wall` instead
+        self._wall_bits = (
+            int.from_bytes(np.packbits(self.wall, bitorder="little").tobytes(), "little")
+            if self.rows * self.cols <= 64
+            else None
+        )
+        # The same grid surrounded by a one-cell wall border, so walkers need no bounds checks
+        self.walls_padded = np.ones((self.rows + 2, self.cols + 2), dtype=np.uint8)
+        self.walls_padded[1:-1, 1:-1] = self.wall
+        # Manhattan distance from every cell to the goal
+        self.manhattan_field = (
+            np.abs(np.arange(self.rows)[:, None] - end.row) + np.abs(np.arange(self.cols)[None, :] - end.col)
+        ).astype(np.int32)
+        # Shortest-path distance from every cell to the goal, -1 where the goal cannot be reached
+        self.goal_dist = self.compute_distance_field()
+        # Rendering built on the first str() call; the maze is not modified after construction
+        self._str: str | None = None
 
     def is_valid_position(self, pos: Position) -> bool:
         """Check if position is within maze bounds."""
         return 0 <= pos.row < self.rows and 0 <= pos.col < self.cols
 
     def is_wall(self, pos: Position) -> bool:
-        """Check if position is a wall."""
-        if not self.is_valid_position(pos):
-            return True  # Out of bounds treated as wall
-        return self.grid[pos.row][pos.col] == Cell.WALL.value
+        """Check if position is a wall. Out of bounds positions are treated as walls."""
+        row, col = pos
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return True
+        if self._wall_bits is not None:
+            return bool(self._wall_bits >> (row * self.cols + col) & 1)
+        return bool(self.wall[row, col])
 
     def move(self, pos: Position, direction: Direction) -> Position:
         """Calculate new position after moving in given direction."""
-        if direction == Direction.UP:
-            return Position(pos.row - 1, pos.col)
-        elif direction == Direction.DOWN:
-            return Position(pos.row + 1, pos.col)
-        elif direction == Direction.LEFT:
-            return Position(pos.row, pos.col - 1)
-        elif direction == Direction.RIGHT:
-            return Position(pos.row, pos.col + 1)
-        return pos
+        return Position(*self.move_rc(pos[0], pos[1], direction))
+
+    @staticmethod
+    def move_rc(row: int, col: int, direction: int) -> tuple[int, int]:
+        """Calculate the (row, col) reached by moving from (row, col) in the direction with the given code."""
+        dr, dc = DIR_DELTAS[direction]
+        return row + dr, col + dc
+
+    def compute_distance_field(self) -> np.ndarray:
+        """Compute the shortest-path distance from every cell to the goal with a breadth-first search.
+
+        Returns:
+            int32 array of shape (rows, cols) holding the number of moves to the goal,
+            or -1 for walls and cells from which the goal cannot be reached
+        """
+        dist = np.full((self.rows, self.cols), -1, dtype=np.int32)
+        if self.is_wall(self.end):
+            return dist
+
+        dist[self.end] = 0
+        queue = deque([self.end])
+        while queue:
+            pos = queue.popleft()
+            for dr, dc in DIR_DELTAS:
+                row, col = pos[0] + dr, pos[1] + dc
+                if 0 <= row < self.rows and 0 <= col < self.cols and not self.wall[row, col] and dist[row, col] < 0:
+                    dist[row, col] = dist[pos] + 1
+                    queue.append(Position(row, col))
+        return dist
 
     def manhattan_distance(self, pos: Position) -> int:
         """Calculate Manhattan distance from position to goal."""
         return abs(pos.row - self.end.row) + abs(pos.col - self.end.col)
 
     def __str__(self) -> str:
-        """String representation of the maze."""
+        """String representation of the maze, rendered once and reused."""
+        if self._str is not None:
+            return self._str
         result = []
-        for i, row in enumerate(self.grid):
+        for i, row in enumerate(self.wall.tolist()):
             row_str = []
-            for j, cell in enumerate(row):
+            for j, wall in enumerate(row):
                 pos = Position(i, j)
                 if pos == self.start:
                     row_str.append("S")
                 elif pos == self.end:
                     row_str.append("E")
-                elif cell == Cell.WALL.value:
+                elif wall:
                     row_str.append("█")
                 else:
                     row_str.append(".")
             result.append(" ".join(row_str))
-        return "\n".join(result)
+        self._str = "\n".join(result)
+        return self._str
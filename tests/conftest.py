@@ -1,7 +1,37 @@
+import os
+import tempfile
+
 import pytest
 
 from ga_maze_pathfinding.maze import Maze, Position
 
+# Throwaway numba cache used while measuring coverage, removed at the end of the session
+_coverage_numba_cache: tempfile.TemporaryDirectory | None = None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Compile numba kernels from scratch with coverage tracing when coverage is measured.
+
+    Kernels loaded from the on-disk cache are not traced, so their lines would not be reported.
+    This runs before the test modules import numba.
+    """
+    global _coverage_numba_cache
+    if config.pluginmanager.get_plugin("_cov") is None or config.getoption("no_cov", default=False):
+        return
+    if "NUMBA_CACHE_DIR" not in os.environ:
+        _coverage_numba_cache = tempfile.TemporaryDirectory(prefix="numba-cache-")
+        os.environ["NUMBA_CACHE_DIR"] = _coverage_numba_cache.name
+    os.environ.setdefault("NUMBA_JIT_COVERAGE", "1")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove the coverage numba cache."""
+    global _coverage_numba_cache
+    if _coverage_numba_cache is not None:
+        os.environ.pop("NUMBA_CACHE_DIR", None)
+        _coverage_numba_cache.cleanup()
+        _coverage_numba_cache = None
+
 
 @pytest.fixture()
 def simple_maze() -> Maze:
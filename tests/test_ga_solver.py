@@ -1,5 +1,23 @@
+import os
+import subprocess
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+import pytest
+from deap import tools
+
+from ga_maze_pathfinding._kernels import _simulate_blocks, _simulate_rows, simplify_pad
 from ga_maze_pathfinding.ga_solver import GASolver
-from ga_maze_pathfinding.maze import Direction, Maze
+from ga_maze_pathfinding.maze import Direction, Maze, Position
+
+
+def _simplify(path: list[Direction]) -> list[Direction]:
+    """Simplify a single path with `simplify_pad`, padding with -1 so the padding can be stripped."""
+    paths = np.array(path, dtype=np.int8).reshape(1, len(path))
+    padding = np.full((1, len(path)), -1, dtype=np.int8)
+    return [Direction(code) for code in simplify_pad(paths, padding)[0].tolist() if code >= 0]
 
 
 def test_ga_solver_initialization(simple_maze: Maze) -> None:
@@ -28,9 +46,10 @@ def test_evaluate_individual(simple_maze: Maze) -> None:
     path = [Direction.RIGHT] * 4 + [Direction.DOWN] * 4
     fitness = solver._evaluate_individual(path)
 
-    # Should return a tuple of two values
+    # Should return a single-value tuple, the sum of both objectives
     assert isinstance(fitness, tuple)
-    assert len(fitness) == 2
+    assert len(fitness) == 1
+    assert fitness[0] == sum(solver._evaluate_objectives(path))
 
 
 def test_visualize_path(simple_maze: Maze) -> None:
@@ -52,11 +71,11 @@ def test_evaluate_individual_reaches_goal(simple_maze: Maze) -> None:
     # Create a path that reaches the goal
     # Move right 4 times, down 4 times to reach (4, 4)
     path = [Direction.RIGHT, Direction.DOWN] * 8
-    fitness = solver._evaluate_individual(path)
+    objectives = solver._evaluate_objectives(path)
 
     # Should have reached the goal with minimal fitness
-    assert fitness[0] >= 0  # Collision penalty
-    assert fitness[1] < 50  # Path length less than max
+    assert objectives[0] >= 0  # Collision penalty
+    assert objectives[1] < 50  # Path length less than max
 
 
 def test_evaluate_individual_with_collisions(simple_maze: Maze) -> None:
@@ -93,147 +112,131 @@ def test_visualize_path_with_goal_reached(simple_maze: Maze) -> None:
     assert "Reached goal" in visualization
 
 
-def test_simplify_individual_opposite_moves_cancel(simple_maze: Maze) -> None:
+def test_simplify_pad_opposite_moves_cancel() -> None:
     """Test that opposite moves cancel each other out."""
-    solver = GASolver(maze=simple_maze)
-
     # UP, DOWN should cancel out
     individual = [Direction.UP, Direction.DOWN]
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == []
 
     # DOWN, UP should cancel out
     individual = [Direction.DOWN, Direction.UP]
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == []
 
     # LEFT, RIGHT should cancel out
     individual = [Direction.LEFT, Direction.RIGHT]
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == []
 
     # RIGHT, LEFT should cancel out
     individual = [Direction.RIGHT, Direction.LEFT]
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == []
 
 
-def test_simplify_individual_multiple_cancellations(simple_maze: Maze) -> None:
+def test_simplify_pad_multiple_cancellations() -> None:
     """Test multiple consecutive cancellations."""
-    solver = GASolver(maze=simple_maze)
-
     # UP, DOWN, DOWN -> DOWN
     individual = [Direction.UP, Direction.DOWN, Direction.DOWN]
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == [Direction.DOWN]
 
     # DOWN, DOWN, UP -> DOWN
     individual = [Direction.DOWN, Direction.DOWN, Direction.UP]
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == [Direction.DOWN]
 
     # LEFT, RIGHT, RIGHT -> RIGHT
     individual = [Direction.LEFT, Direction.RIGHT, Direction.RIGHT]
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == [Direction.RIGHT]
 
 
-def test_simplify_individual_no_cancellations(simple_maze: Maze) -> None:
+def test_simplify_pad_no_cancellations() -> None:
     """Test that non-opposite moves are preserved."""
-    solver = GASolver(maze=simple_maze)
-
     # All same direction
     individual = [Direction.RIGHT, Direction.RIGHT, Direction.RIGHT]
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == [Direction.RIGHT, Direction.RIGHT, Direction.RIGHT]
 
     # Different directions but no opposites
     individual = [Direction.RIGHT, Direction.DOWN, Direction.LEFT, Direction.UP]
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == [Direction.RIGHT, Direction.DOWN, Direction.LEFT, Direction.UP]
 
 
-def test_simplify_individual_complex_pattern(simple_maze: Maze) -> None:
+def test_simplify_pad_complex_pattern() -> None:
     """Test complex patterns with multiple cancellations."""
-    solver = GASolver(maze=simple_maze)
-
     # RIGHT, LEFT, RIGHT, LEFT -> empty
     individual = [Direction.RIGHT, Direction.LEFT, Direction.RIGHT, Direction.LEFT]
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == []
 
     # UP, DOWN, RIGHT, LEFT -> empty
     individual = [Direction.UP, Direction.DOWN, Direction.RIGHT, Direction.LEFT]
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == []
 
     # UP, UP, DOWN, RIGHT -> UP, RIGHT
     individual = [Direction.UP, Direction.UP, Direction.DOWN, Direction.RIGHT]
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == [Direction.UP, Direction.RIGHT]
 
 
-def test_simplify_individual_preserves_efficient_path(simple_maze: Maze) -> None:
+def test_simplify_pad_preserves_efficient_path() -> None:
     """Test that already efficient paths are preserved."""
-    solver = GASolver(maze=simple_maze)
-
     # Efficient path: right then down
     individual = [Direction.RIGHT, Direction.RIGHT, Direction.DOWN, Direction.DOWN]
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == [Direction.RIGHT, Direction.RIGHT, Direction.DOWN, Direction.DOWN]
 
 
-def test_simplify_individual_empty_input(simple_maze: Maze) -> None:
+def test_simplify_pad_empty_input() -> None:
     """Test that empty input returns empty output."""
-    solver = GASolver(maze=simple_maze)
-
     individual: list[Direction] = []
-    simplified = solver._simplify_individual(individual)
+    simplified = _simplify(individual)
     assert simplified == []
 
 
-def test_simplify_individual_single_direction(simple_maze: Maze) -> None:
+def test_simplify_pad_single_direction() -> None:
     """Test single direction is preserved."""
-    solver = GASolver(maze=simple_maze)
-
     for direction in [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]:
         individual = [direction]
-        simplified = solver._simplify_individual(individual)
+        simplified = _simplify(individual)
         assert simplified == [direction]
 
 
-def test_pad_individual(simple_maze: Maze) -> None:
-    """Test that _pad_individual pads to the correct length."""
-    solver = GASolver(maze=simple_maze, max_path_length=20)
+def test_simplify_pad_pads_rows() -> None:
+    """Test that simplify_pad fills simplified rows up with padding to the padding width."""
+    paths = np.array([[Direction.RIGHT, Direction.DOWN], [Direction.UP, Direction.DOWN]], dtype=np.int8)
+    padding = np.full((2, 4), Direction.LEFT, dtype=np.int8)
 
-    # Short individual
-    individual = [Direction.RIGHT, Direction.DOWN]
-    padded = solver._pad_individual(individual, 10)
-    assert len(padded) == 10
-    assert padded[:2] == [Direction.RIGHT, Direction.DOWN]
+    result = simplify_pad(paths, padding)
 
-    # Already at target length
-    individual = [Direction.RIGHT] * 10
-    padded = solver._pad_individual(individual, 10)
-    assert len(padded) == 10
+    assert result.tolist() == [
+        [Direction.RIGHT, Direction.DOWN, Direction.LEFT, Direction.LEFT],
+        [Direction.LEFT] * 4,
+    ]
 
 
-def test_mutate_individual_applies_simplification(simple_maze: Maze) -> None:
-    """Test that mutation applies simplification afterward."""
+def test_simplify_population_applies_simplification(simple_maze: Maze) -> None:
+    """Test that offspring are simplified in place and padded back to max_path_length."""
     solver = GASolver(maze=simple_maze, max_path_length=10)
+    cancelling, straight = solver.toolbox.population(n=2)
 
-    # Create an individual with opposite moves
-    individual = [Direction.RIGHT, Direction.LEFT, Direction.RIGHT, Direction.LEFT] * 2
+    # One individual where every move cancels out, one without opposite moves
+    cancelling[:] = [Direction.RIGHT, Direction.LEFT] * 5
+    straight[:] = [Direction.RIGHT] * 10
 
-    # Mutate with low probability to keep some structure
-    mutated = solver._mutate_individual(individual, indpb=0.1)
+    solver._simplify_population([cancelling, straight])
 
-    # Should still be max_path_length after padding
-    assert len(mutated[0]) == solver.max_path_length
+    assert len(cancelling) == solver.max_path_length
+    assert straight.tolist() == [Direction.RIGHT] * 10
 
 
-def test_crossover_applies_simplification(simple_maze: Maze) -> None:
-    """Test that crossover applies simplification to offspring."""
+def test_crossover_keeps_offspring_length(simple_maze: Maze) -> None:
+    """Test that crossover keeps offspring at max_path_length."""
     solver = GASolver(maze=simple_maze, max_path_length=20)
 
     # Create two parents with potentially canceling moves
@@ -245,3 +248,398 @@ def test_crossover_applies_simplification(simple_maze: Maze) -> None:
     # Both offspring should be padded back to max_path_length
     assert len(offspring1) == solver.max_path_length
     assert len(offspring2) == solver.max_path_length
+
+
+def test_mutate_population_in_place(simple_maze: Maze) -> None:
+    """Test that batched mutation rewrites every individual with valid directions."""
+    solver = GASolver(maze=simple_maze, max_path_length=12)
+    population = solver.toolbox.population(n=5)
+    originals = [individual.copy() for individual in population]
+
+    solver._mutate_population(population, indpb=0.0)
+    assert all(np.array_equal(a, b) for a, b in zip(population, originals, strict=True))
+
+    solver._mutate_population(population, indpb=1.0)
+    assert all(len(individual) == 12 for individual in population)
+    assert all(0 <= code < len(Direction) for individual in population for code in individual)
+
+    solver._mutate_population([], indpb=1.0)
+
+
+def test_evaluate_population_matches_individual(simple_maze: Maze) -> None:
+    """Test that batched evaluation gives the same fitness as evaluating one by one."""
+    solver = GASolver(maze=simple_maze, max_path_length=16)
+
+    population = [
+        [Direction.RIGHT, Direction.DOWN] * 8,
+        [Direction.UP] * 16,
+        [Direction.DOWN, Direction.RIGHT, Direction.LEFT, Direction.UP] * 4,
+    ]
+    fitnesses = solver._evaluate_population(population)
+
+    assert fitnesses == [solver._evaluate_individual(ind) for ind in population]
+    assert solver._evaluate_population([]) == []
+
+
+def test_parallel_evaluation_matches_serial(simple_maze: Maze) -> None:
+    """Test that evaluating in worker processes gives the same fitness as serial evaluation."""
+    population = [
+        [Direction.RIGHT, Direction.DOWN] * 8,
+        [Direction.UP] * 16,
+        [Direction.DOWN, Direction.RIGHT, Direction.LEFT, Direction.UP] * 4,
+    ]
+    serial = GASolver(maze=simple_maze, max_path_length=16)
+
+    with GASolver(maze=simple_maze, population_size=20, max_generations=3, max_path_length=16, n_workers=2) as solver:
+        assert solver._evaluate_population(population) == serial._evaluate_population(population)
+        with pytest.raises(RuntimeError, match="close"):
+            solver.maze = simple_maze
+        best_path, _ = solver.solve(verbose=False)
+
+    assert len(best_path) == 16
+    assert solver._pool is None
+    assert solver._shm is None
+
+
+def test_evaluate_population_uses_fitness_cache(simple_maze: Maze) -> None:
+    """Test that evaluated paths are cached and the cache stays bounded."""
+    solver = GASolver(maze=simple_maze, population_size=1, max_path_length=4)
+    population = [[direction] * 4 for direction in Direction]
+
+    fitnesses = solver._evaluate_population(population)
+    assert len(solver._fitness_cache) == 4
+
+    # Cached values are returned without simulating the path again
+    (up_key,) = solver._cache_keys(np.array([[Direction.UP] * 4], dtype=np.int8))
+    solver._fitness_cache[up_key] = (-1.0,)
+    assert solver._evaluate_individual([Direction.UP] * 4) == (-1.0,)
+    assert solver._evaluate_population(population)[1:] == fitnesses[1:]
+
+    # Oldest entries are evicted once the cache is full
+    solver._evaluate_population(
+        [[first, second, Direction.LEFT, Direction.UP] for first in Direction for second in Direction]
+    )
+    assert len(solver._fitness_cache) == solver._fitness_cache_size == 10
+    assert up_key not in solver._fitness_cache
+
+
+def test_fitness_cache_evicts_least_recently_used(simple_maze: Maze, complex_maze: Maze) -> None:
+    """Test that cache hits are kept over older entries and replacing the maze clears the cache."""
+    solver = GASolver(maze=simple_maze, population_size=1, max_path_length=4)
+    up, *others = [[direction] * 4 for direction in Direction]
+    solver._evaluate_population([up, *others])
+
+    # Reusing the first path makes the second one the least recently used
+    solver._evaluate_population([up])
+    solver._evaluate_population([[Direction.LEFT, Direction.UP] * 2 for _ in range(7)])
+    solver._evaluate_population([[first, Direction.UP, Direction.UP, Direction.UP] for first in Direction][1:])
+    solver._evaluate_population([[Direction.RIGHT, first, Direction.UP, Direction.UP] for first in Direction])
+    assert len(solver._fitness_cache) == 10
+    assert solver._cache_keys(np.array([up], dtype=np.int8))[0] in solver._fitness_cache
+    assert solver._cache_keys(np.array([others[0]], dtype=np.int8))[0] not in solver._fitness_cache
+
+    solver.maze = complex_maze
+    assert len(solver._fitness_cache) == 0
+    assert solver._shape == (complex_maze.rows, complex_maze.cols)
+    assert solver.target_path_length == GASolver(maze=complex_maze).target_path_length == 41
+
+    explicit = GASolver(maze=simple_maze, target_path_length=30)
+    explicit.maze = complex_maze
+    assert explicit.target_path_length == 30
+
+
+def test_evaluate_population_simulates_duplicates_once(simple_maze: Maze, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that identical paths within one population are simulated once and share their fitness."""
+    solver = GASolver(maze=simple_maze, max_path_length=6)
+    simulated = []
+    compute_fitness = solver._compute_fitness
+
+    def counting_compute_fitness(paths: np.ndarray) -> list[tuple[float]]:
+        simulated.append(len(paths))
+        return compute_fitness(paths)
+
+    monkeypatch.setattr(solver, "_compute_fitness", counting_compute_fitness)
+    population = [[Direction.RIGHT] * 6, [Direction.DOWN] * 6, [Direction.RIGHT] * 6, [Direction.RIGHT] * 6]
+    fitnesses = solver._evaluate_population(population)
+
+    assert simulated == [2]
+    assert fitnesses[0] == fitnesses[2] == fitnesses[3]
+    assert fitnesses[1] == solver._evaluate_individual([Direction.DOWN] * 6)
+
+
+def test_mutate_individual_probability_bounds(simple_maze: Maze) -> None:
+    """Test that indpb=0 keeps every gene and indpb=1 redraws every gene."""
+    solver = GASolver(maze=simple_maze, max_path_length=10)
+
+    individual = [Direction.RIGHT, Direction.DOWN] * 5
+    (mutated,) = solver._mutate_individual(individual[:], indpb=0.0)
+    assert mutated == individual
+
+    (mutated,) = solver._mutate_individual([Direction.RIGHT] * 10, indpb=1.0)
+    assert len(mutated) == 10
+    assert all(direction in Direction for direction in mutated)
+
+
+def test_select_tournament(simple_maze: Maze) -> None:
+    """Test that tournaments pick the best aspirant."""
+    solver = GASolver(maze=simple_maze, max_path_length=4)
+    population = solver.toolbox.population(n=5)
+    for ind, fitness in zip(population, [4.0, 10.0, 1.0, 2.0, 3.0], strict=True):
+        ind.fitness.values = (fitness,)
+
+    selected = solver._select_tournament(population, k=50, tournsize=1)
+    assert len(selected) == 50
+    assert all(any(ind is other for other in population) for ind in selected)
+
+    # With many aspirants per tournament the best individual always wins
+    selected = solver._select_tournament(population, k=10, tournsize=100)
+    assert all(ind is population[2] for ind in selected)
+
+
+def test_evolution_stops_when_target_path_found(simple_maze: Maze) -> None:
+    """Test that evolution stops once a good enough path is found."""
+    solver = GASolver(maze=simple_maze, population_size=10, max_generations=50, max_path_length=12)
+    assert solver.target_path_length == 9
+
+    # Seed the population with an optimal path (4 moves right, 4 moves down)
+    population = solver.toolbox.population(n=solver.population_size)
+    population[0][:8] = [Direction.RIGHT] * 4 + [Direction.DOWN] * 4
+    hof = tools.HallOfFame(1)
+
+    _, logbook = solver._ea_simple_with_early_stopping(
+        population, solver.toolbox, cxpb=0.7, mutpb=0.2, ngen=50, stats=False, halloffame=hof, verbose=False
+    )
+
+    assert len(logbook) == 1
+    assert hof[0].fitness.values == (9,)
+
+
+def test_target_check_skips_unchanged_best(complex_maze: Maze, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the early stopping target is only checked again when the hall of fame best changes."""
+    solver = GASolver(maze=complex_maze, population_size=20, max_path_length=60, target_path_length=1)
+    checked = []
+    evaluate_objectives = solver._evaluate_objectives
+
+    def recording_evaluate_objectives(individual: Sequence[Direction]) -> tuple[float, float]:
+        checked.append(individual)
+        return evaluate_objectives(individual)
+
+    monkeypatch.setattr(solver, "_evaluate_objectives", recording_evaluate_objectives)
+    population = solver.toolbox.population(n=20)
+    hof = tools.HallOfFame(1, similar=np.array_equal)
+
+    # Without crossover and mutation the offspring are clones, so the best never changes
+    _, logbook = solver._ea_simple_with_early_stopping(
+        population, solver.toolbox, cxpb=0.0, mutpb=0.0, ngen=5, stats=False, halloffame=hof, verbose=False
+    )
+
+    assert len(logbook) == 6
+    assert len(checked) == 1
+    assert checked[0] is hof[0]
+
+
+def test_is_target_reached(simple_maze: Maze) -> None:
+    solver = GASolver(maze=simple_maze, max_path_length=30, target_path_length=12)
+
+    assert solver._is_target_reached((0, 9))
+    assert solver._is_target_reached((0, 12))
+    assert not solver._is_target_reached((0, 13))
+    assert not solver._is_target_reached((10, 9))
+    assert not solver._is_target_reached((0, 30))
+
+
+def test_individuals_are_int8_arrays(simple_maze: Maze) -> None:
+    solver = GASolver(maze=simple_maze, max_path_length=30)
+
+    individual = solver.toolbox.individual()
+
+    assert isinstance(individual, np.ndarray)
+    assert individual.dtype == np.int8
+    assert individual.shape == (30,)
+    assert hasattr(individual, "fitness")
+
+    offspring1, offspring2 = solver._crossover_individuals(individual, solver.toolbox.clone(individual))
+    assert offspring1.dtype == offspring2.dtype == np.int8
+
+
+def test_visualize_path_counts_revisited_steps(simple_maze: Maze) -> None:
+    solver = GASolver(maze=simple_maze)
+
+    visualization = solver.visualize_path([Direction.RIGHT, Direction.LEFT, Direction.RIGHT])
+
+    assert "Path length: 4 steps" in visualization
+    assert "Reached goal: False" in visualization
+
+
+def test_init_population(simple_maze: Maze) -> None:
+    solver = GASolver(maze=simple_maze, max_path_length=12)
+
+    population = solver.toolbox.population(n=7)
+
+    assert len(population) == 7
+    assert all(ind.shape == (12,) and ind.dtype == np.int8 for ind in population)
+    assert all(not ind.fitness.valid for ind in population)
+    assert population[0].fitness is not population[1].fitness
+
+    # Clones own their genes, so varying them leaves the population untouched
+    original = population[0].copy()
+    clone = solver.toolbox.clone(population[0])
+    clone[:] = (original + 1) % 4
+    assert np.array_equal(population[0], original)
+
+
+def test_crossover_population_swaps_one_segment_per_pair(simple_maze: Maze) -> None:
+    solver = GASolver(maze=simple_maze, max_path_length=10)
+    parents1 = [[Direction.RIGHT] * 10 for _ in range(20)]
+    parents2 = [[Direction.DOWN] * 10 for _ in range(20)]
+
+    solver._crossover_population(parents1, parents2)
+
+    for offspring1, offspring2 in zip(parents1, parents2, strict=True):
+        swapped = np.flatnonzero(np.asarray(offspring1) == Direction.DOWN)
+        assert 0 < len(swapped) < 10
+        assert swapped.tolist() == list(range(swapped[0], swapped[-1] + 1))
+        assert np.array_equal(np.asarray(offspring2) == Direction.RIGHT, np.asarray(offspring1) == Direction.DOWN)
+
+
+def test_cache_keys_are_packed_and_unique() -> None:
+    paths = np.array([[0, 1, 2, 3, 3], [3, 2, 1, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 1]], dtype=np.int8)
+
+    keys = GASolver._cache_keys(paths)
+
+    assert len(set(keys)) == 4
+    assert all(len(key) == 4 + 2 for key in keys)
+    assert keys[0][4:] == bytes([0b11100100, 0b11])
+    assert GASolver._cache_keys(paths[:, :4])[2] != keys[2]
+
+
+def test_solvers_share_creator_classes(simple_maze: Maze) -> None:
+    first = GASolver(simple_maze, population_size=4, max_path_length=4).toolbox.individual()
+    second = GASolver(simple_maze, population_size=4, max_path_length=4).toolbox.individual()
+
+    assert type(first) is type(second)
+
+
+def test_greedy_path_reaches_goal_in_open_maze() -> None:
+    maze = Maze(grid=[[0] * 4 for _ in range(4)], start=Position(0, 0), end=Position(3, 3))
+    solver = GASolver(maze=maze, max_path_length=10)
+
+    path = solver._greedy_path()
+
+    assert path.dtype == np.int8
+    assert len(path) == 10
+    assert solver._evaluate_objectives([Direction(code) for code in path]) == (0.0, 7.0)
+
+
+def test_seed_population_replaces_first_tenth(simple_maze: Maze) -> None:
+    solver = GASolver(maze=simple_maze, population_size=20, max_path_length=16)
+    population = solver.toolbox.population(n=20)
+    originals = [individual.copy() for individual in population]
+
+    solver._seed_population(population, indpb=0.0)
+
+    for seeded in population[:2]:
+        assert seeded.dtype == np.int8
+        assert len(seeded) == 16
+        assert not seeded.fitness.valid
+    for individual, original in zip(population[2:], originals[2:], strict=True):
+        np.testing.assert_array_equal(individual, original)
+
+
+def test_solve_returns_trace_of_best_path(simple_maze: Maze) -> None:
+    solver = GASolver(maze=simple_maze, population_size=20, max_generations=3, max_path_length=16)
+
+    best_path, stats = solver.solve(verbose=False)
+
+    assert stats["best_trace"][0] == simple_maze.start
+    assert stats["best_trace"] == solver._trace(best_path)
+    assert solver.visualize_path(best_path, stats["best_trace"]) == solver.visualize_path(best_path)
+
+
+def test_simplify_pad_matches_simplify_then_pad() -> None:
+    paths = np.random.default_rng(0).integers(0, 4, size=(50, 10), dtype=np.int8)
+    padding = np.full((50, 12), Direction.RIGHT, dtype=np.int8)
+
+    result = simplify_pad(paths, padding)
+
+    assert result.shape == (50, 12)
+    for path, row in zip(paths, result, strict=True):
+        # Reference stack simplification: opposite codes differ only in the lowest bit
+        simplified: list[int] = []
+        for code in path.tolist():
+            if simplified and simplified[-1] ^ 1 == code:
+                simplified.pop()
+            else:
+                simplified.append(code)
+        assert row.tolist() == simplified + [Direction.RIGHT] * (12 - len(simplified))
+
+
+def test_clone_population_copies_codes_and_fitness(simple_maze: Maze) -> None:
+    solver = GASolver(maze=simple_maze, max_path_length=8)
+    population = solver.toolbox.population(n=3)
+    population[0].fitness.values = (5.0,)
+
+    clones = solver.toolbox.clone_batch(population)
+    clones[0][:] = Direction.UP
+    del clones[0].fitness.values
+
+    assert population[0].fitness.values == (5.0,)
+    assert clones[0] is not population[0]
+    for clone, individual in zip(clones[1:], population[1:], strict=True):
+        np.testing.assert_array_equal(clone, individual)
+        assert not clone.fitness.valid
+    assert not np.shares_memory(clones[0], population[0])
+
+
+def test_record_stats(simple_maze: Maze) -> None:
+    solver = GASolver(maze=simple_maze, max_path_length=4)
+    population = solver.toolbox.population(n=3)
+    for individual, fitness in zip(population, [4.0, 1.0, 7.0], strict=True):
+        individual.fitness.values = (fitness,)
+
+    assert solver._record_stats(population) == {"avg": 4.0, "min": 1.0, "max": 7.0}
+
+
+def test_simulate_blocks_split_matches_serial(simple_maze: Maze) -> None:
+    paths = np.random.default_rng(0).integers(0, 4, size=(10, 12), dtype=np.int8)
+    args = (simple_maze.walls_padded.ravel(), simple_maze.rows, simple_maze.cols, *simple_maze.start, *simple_maze.end)
+
+    single = _simulate_rows(paths, *args)
+
+    np.testing.assert_array_equal(_simulate_blocks(paths, *args, 1), single)
+    np.testing.assert_array_equal(_simulate_blocks(paths, *args, 3), single)
+    np.testing.assert_array_equal(_simulate_blocks(paths, *args, 10), single)
+
+
+@pytest.mark.parametrize("threading_layer", ["workqueue", "default"])
+def test_solvers_evaluate_concurrently_from_threads(threading_layer: str) -> None:
+    """Test that solvers evaluate large populations from several threads at once.
+
+    Runs in a fresh interpreter with no evaluation on the main thread beforehand. The workqueue layer
+    aborts on concurrent parallel launches, and TBB (preferred by default) hangs at exit once started
+    off the main thread.
+    """
+    script = """
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ga_maze_pathfinding.ga_solver import GASolver
+from ga_maze_pathfinding.maze import Maze, Position
+
+maze = Maze(grid=[[0] * 12 for _ in range(12)], start=Position(0, 0), end=Position(11, 11))
+solvers = [GASolver(maze=maze, max_path_length=100) for _ in range(4)]
+paths = np.random.default_rng(0).integers(0, 4, size=(2000, 100), dtype=np.int8)
+with ThreadPoolExecutor(max_workers=4) as executor:
+    for _ in range(5):
+        results = list(executor.map(lambda solver: solver._compute_objectives(paths), solvers))
+expected = solvers[0]._compute_objectives(paths)
+assert all(np.array_equal(a, b) for result in results for a, b in zip(result, expected, strict=True))
+"""
+    env = {**os.environ, "NUMBA_THREADING_LAYER": threading_layer, "NUMBA_NUM_THREADS": "4"}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(Path(__file__).parents[1]), env.get("PYTHONPATH")]))
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=60
+    )
+
+    assert completed.returncode == 0, completed.stderr
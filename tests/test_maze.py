@@ -1,3 +1,5 @@
+import numpy as np
+
 from ga_maze_pathfinding.maze import Direction, Maze, Position
 
 
@@ -53,9 +55,66 @@ def test_maze_string_representation(simple_maze: Maze) -> None:
     assert "E" in maze_str
     assert "█" in maze_str
     assert "." in maze_str
+    assert str(simple_maze) is maze_str
 
 
 def test_out_of_bounds_is_wall(simple_maze: Maze) -> None:
     assert simple_maze.is_wall(Position(-1, 0)) is True
     assert simple_maze.is_wall(Position(0, -1)) is True
     assert simple_maze.is_wall(Position(100, 100)) is True
+
+
+def test_wall_array(simple_maze: Maze) -> None:
+    assert simple_maze.wall.dtype == np.uint8
+    assert simple_maze.wall.shape == (5, 5)
+    assert simple_maze.wall.flags.c_contiguous
+    assert simple_maze.wall.tolist() == simple_maze.grid
+
+
+def test_wall_bits_match_grid(simple_maze: Maze, complex_maze: Maze) -> None:
+    assert simple_maze._wall_bits is not None
+    assert complex_maze._wall_bits is None
+    for maze in (simple_maze, complex_maze):
+        for row in range(maze.rows):
+            for col in range(maze.cols):
+                assert maze.is_wall(Position(row, col)) == (maze.grid[row][col] == 1)
+
+
+def test_opposite_directions_differ_in_lowest_bit() -> None:
+    assert Direction(Direction.UP ^ 1) == Direction.DOWN
+    assert Direction(Direction.DOWN ^ 1) == Direction.UP
+    assert Direction(Direction.LEFT ^ 1) == Direction.RIGHT
+    assert Direction(Direction.RIGHT ^ 1) == Direction.LEFT
+
+
+def test_goal_distance_field(simple_maze: Maze) -> None:
+    assert simple_maze.goal_dist.dtype == np.int32
+    assert simple_maze.goal_dist[4, 4] == 0
+    assert simple_maze.goal_dist[0, 0] == 8
+    assert simple_maze.goal_dist[1, 1] == -1  # Wall
+    assert simple_maze.goal_dist[4, 2] == 4  # Around the wall at (4, 3)
+
+
+def test_goal_distance_field_unreachable() -> None:
+    maze = Maze(grid=[[0, 1, 0], [0, 1, 0]], start=Position(0, 0), end=Position(0, 2))
+
+    assert maze.goal_dist.tolist() == [[-1, -1, 0], [-1, -1, 1]]
+
+
+def test_walls_padded(simple_maze: Maze) -> None:
+    assert simple_maze.walls_padded.shape == (7, 7)
+    assert simple_maze.walls_padded[[0, -1], :].all()
+    assert simple_maze.walls_padded[:, [0, -1]].all()
+    np.testing.assert_array_equal(simple_maze.walls_padded[1:-1, 1:-1], simple_maze.wall)
+
+
+def test_manhattan_field(simple_maze: Maze) -> None:
+    for row in range(simple_maze.rows):
+        for col in range(simple_maze.cols):
+            assert simple_maze.manhattan_field[row, col] == simple_maze.manhattan_distance(Position(row, col))
+
+
+def test_move_rc() -> None:
+    assert Maze.move_rc(2, 2, Direction.UP) == (1, 2)
+    assert Maze.move_rc(2, 2, Direction.RIGHT) == (2, 3)
+    assert Maze.move_rc(0, 0, Direction.LEFT) == (0, -1)